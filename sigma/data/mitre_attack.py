@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, FrozenSet
 mitre_attack_version: str = "11.3"
 mitre_attack_tactics: Dict[str, str] = {   'TA0001': 'initial-access',
     'TA0002': 'execution',
@@ -590,3 +590,593 @@ mitre_attack_techniques: Dict[str, str] = {   'T1001': 'Data Obfuscation',
     'T1621': 'Multi-Factor Authentication Request Generation',
     'T1622': 'Debugger Evasion',
     'T1647': 'Plist File Modification'}
+mitre_attack_tactics_normalized: FrozenSet[str] = frozenset({   'collection',
+              'command_and_control',
+              'credential_access',
+              'defense_evasion',
+              'discovery',
+              'execution',
+              'exfiltration',
+              'impact',
+              'initial_access',
+              'lateral_movement',
+              'persistence',
+              'privilege_escalation',
+              'reconnaissance',
+              'resource_development'})
+mitre_attack_technique_ids_lower: FrozenSet[str] = frozenset({   't1001',
+              't1001.001',
+              't1001.002',
+              't1001.003',
+              't1003',
+              't1003.001',
+              't1003.002',
+              't1003.003',
+              't1003.004',
+              't1003.005',
+              't1003.006',
+              't1003.007',
+              't1003.008',
+              't1005',
+              't1006',
+              't1007',
+              't1008',
+              't1010',
+              't1011',
+              't1011.001',
+              't1012',
+              't1014',
+              't1016',
+              't1016.001',
+              't1018',
+              't1020',
+              't1020.001',
+              't1021',
+              't1021.001',
+              't1021.002',
+              't1021.003',
+              't1021.004',
+              't1021.005',
+              't1021.006',
+              't1025',
+              't1027',
+              't1027.001',
+              't1027.002',
+              't1027.003',
+              't1027.004',
+              't1027.005',
+              't1027.006',
+              't1029',
+              't1030',
+              't1033',
+              't1036',
+              't1036.001',
+              't1036.002',
+              't1036.003',
+              't1036.004',
+              't1036.005',
+              't1036.006',
+              't1036.007',
+              't1037',
+              't1037.001',
+              't1037.002',
+              't1037.003',
+              't1037.004',
+              't1037.005',
+              't1039',
+              't1040',
+              't1041',
+              't1046',
+              't1047',
+              't1048',
+              't1048.001',
+              't1048.002',
+              't1048.003',
+              't1049',
+              't1052',
+              't1052.001',
+              't1053',
+              't1053.002',
+              't1053.003',
+              't1053.005',
+              't1053.006',
+              't1053.007',
+              't1055',
+              't1055.001',
+              't1055.002',
+              't1055.003',
+              't1055.004',
+              't1055.005',
+              't1055.008',
+              't1055.009',
+              't1055.011',
+              't1055.012',
+              't1055.013',
+              't1055.014',
+              't1055.015',
+              't1056',
+              't1056.001',
+              't1056.002',
+              't1056.003',
+              't1056.004',
+              't1057',
+              't1059',
+              't1059.001',
+              't1059.002',
+              't1059.003',
+              't1059.004',
+              't1059.005',
+              't1059.006',
+              't1059.007',
+              't1059.008',
+              't1068',
+              't1069',
+              't1069.001',
+              't1069.002',
+              't1069.003',
+              't1070',
+              't1070.001',
+              't1070.002',
+              't1070.003',
+              't1070.004',
+              't1070.005',
+              't1070.006',
+              't1071',
+              't1071.001',
+              't1071.002',
+              't1071.003',
+              't1071.004',
+              't1072',
+              't1074',
+              't1074.001',
+              't1074.002',
+              't1078',
+              't1078.001',
+              't1078.002',
+              't1078.003',
+              't1078.004',
+              't1080',
+              't1082',
+              't1083',
+              't1087',
+              't1087.001',
+              't1087.002',
+              't1087.003',
+              't1087.004',
+              't1090',
+              't1090.001',
+              't1090.002',
+              't1090.003',
+              't1090.004',
+              't1091',
+              't1092',
+              't1095',
+              't1098',
+              't1098.001',
+              't1098.002',
+              't1098.003',
+              't1098.004',
+              't1098.005',
+              't1102',
+              't1102.001',
+              't1102.002',
+              't1102.003',
+              't1104',
+              't1105',
+              't1106',
+              't1110',
+              't1110.001',
+              't1110.002',
+              't1110.003',
+              't1110.004',
+              't1111',
+              't1112',
+              't1113',
+              't1114',
+              't1114.001',
+              't1114.002',
+              't1114.003',
+              't1115',
+              't1119',
+              't1120',
+              't1123',
+              't1124',
+              't1125',
+              't1127',
+              't1127.001',
+              't1129',
+              't1132',
+              't1132.001',
+              't1132.002',
+              't1133',
+              't1134',
+              't1134.001',
+              't1134.002',
+              't1134.003',
+              't1134.004',
+              't1134.005',
+              't1135',
+              't1136',
+              't1136.001',
+              't1136.002',
+              't1136.003',
+              't1137',
+              't1137.001',
+              't1137.002',
+              't1137.003',
+              't1137.004',
+              't1137.005',
+              't1137.006',
+              't1140',
+              't1176',
+              't1185',
+              't1187',
+              't1189',
+              't1190',
+              't1195',
+              't1195.001',
+              't1195.002',
+              't1195.003',
+              't1197',
+              't1199',
+              't1200',
+              't1201',
+              't1202',
+              't1203',
+              't1204',
+              't1204.001',
+              't1204.002',
+              't1204.003',
+              't1205',
+              't1205.001',
+              't1207',
+              't1210',
+              't1211',
+              't1212',
+              't1213',
+              't1213.001',
+              't1213.002',
+              't1213.003',
+              't1216',
+              't1216.001',
+              't1217',
+              't1218',
+              't1218.001',
+              't1218.002',
+              't1218.003',
+              't1218.004',
+              't1218.005',
+              't1218.007',
+              't1218.008',
+              't1218.009',
+              't1218.010',
+              't1218.011',
+              't1218.012',
+              't1218.013',
+              't1218.014',
+              't1219',
+              't1220',
+              't1221',
+              't1222',
+              't1222.001',
+              't1222.002',
+              't1480',
+              't1480.001',
+              't1482',
+              't1484',
+              't1484.001',
+              't1484.002',
+              't1485',
+              't1486',
+              't1489',
+              't1490',
+              't1491',
+              't1491.001',
+              't1491.002',
+              't1495',
+              't1496',
+              't1497',
+              't1497.001',
+              't1497.002',
+              't1497.003',
+              't1498',
+              't1498.001',
+              't1498.002',
+              't1499',
+              't1499.001',
+              't1499.002',
+              't1499.003',
+              't1499.004',
+              't1505',
+              't1505.001',
+              't1505.002',
+              't1505.003',
+              't1505.004',
+              't1505.005',
+              't1518',
+              't1518.001',
+              't1525',
+              't1526',
+              't1528',
+              't1529',
+              't1530',
+              't1531',
+              't1534',
+              't1535',
+              't1537',
+              't1538',
+              't1539',
+              't1542',
+              't1542.001',
+              't1542.002',
+              't1542.003',
+              't1542.004',
+              't1542.005',
+              't1543',
+              't1543.001',
+              't1543.002',
+              't1543.003',
+              't1543.004',
+              't1546',
+              't1546.001',
+              't1546.002',
+              't1546.003',
+              't1546.004',
+              't1546.005',
+              't1546.006',
+              't1546.007',
+              't1546.008',
+              't1546.009',
+              't1546.010',
+              't1546.011',
+              't1546.012',
+              't1546.013',
+              't1546.014',
+              't1546.015',
+              't1547',
+              't1547.001',
+              't1547.002',
+              't1547.003',
+              't1547.004',
+              't1547.005',
+              't1547.006',
+              't1547.007',
+              't1547.008',
+              't1547.009',
+              't1547.010',
+              't1547.012',
+              't1547.013',
+              't1547.014',
+              't1547.015',
+              't1548',
+              't1548.001',
+              't1548.002',
+              't1548.003',
+              't1548.004',
+              't1550',
+              't1550.001',
+              't1550.002',
+              't1550.003',
+              't1550.004',
+              't1552',
+              't1552.001',
+              't1552.002',
+              't1552.003',
+              't1552.004',
+              't1552.005',
+              't1552.006',
+              't1552.007',
+              't1553',
+              't1553.001',
+              't1553.002',
+              't1553.003',
+              't1553.004',
+              't1553.005',
+              't1553.006',
+              't1554',
+              't1555',
+              't1555.001',
+              't1555.002',
+              't1555.003',
+              't1555.004',
+              't1555.005',
+              't1556',
+              't1556.001',
+              't1556.002',
+              't1556.003',
+              't1556.004',
+              't1556.005',
+              't1557',
+              't1557.001',
+              't1557.002',
+              't1557.003',
+              't1558',
+              't1558.001',
+              't1558.002',
+              't1558.003',
+              't1558.004',
+              't1559',
+              't1559.001',
+              't1559.002',
+              't1559.003',
+              't1560',
+              't1560.001',
+              't1560.002',
+              't1560.003',
+              't1561',
+              't1561.001',
+              't1561.002',
+              't1562',
+              't1562.001',
+              't1562.002',
+              't1562.003',
+              't1562.004',
+              't1562.006',
+              't1562.007',
+              't1562.008',
+              't1562.009',
+              't1562.010',
+              't1563',
+              't1563.001',
+              't1563.002',
+              't1564',
+              't1564.001',
+              't1564.002',
+              't1564.003',
+              't1564.004',
+              't1564.005',
+              't1564.006',
+              't1564.007',
+              't1564.008',
+              't1564.009',
+              't1564.010',
+              't1565',
+              't1565.001',
+              't1565.002',
+              't1565.003',
+              't1566',
+              't1566.001',
+              't1566.002',
+              't1566.003',
+              't1567',
+              't1567.001',
+              't1567.002',
+              't1568',
+              't1568.001',
+              't1568.002',
+              't1568.003',
+              't1569',
+              't1569.001',
+              't1569.002',
+              't1570',
+              't1571',
+              't1572',
+              't1573',
+              't1573.001',
+              't1573.002',
+              't1574',
+              't1574.001',
+              't1574.002',
+              't1574.004',
+              't1574.005',
+              't1574.006',
+              't1574.007',
+              't1574.008',
+              't1574.009',
+              't1574.010',
+              't1574.011',
+              't1574.012',
+              't1574.013',
+              't1578',
+              't1578.001',
+              't1578.002',
+              't1578.003',
+              't1578.004',
+              't1580',
+              't1583',
+              't1583.001',
+              't1583.002',
+              't1583.003',
+              't1583.004',
+              't1583.005',
+              't1583.006',
+              't1584',
+              't1584.001',
+              't1584.002',
+              't1584.003',
+              't1584.004',
+              't1584.005',
+              't1584.006',
+              't1585',
+              't1585.001',
+              't1585.002',
+              't1586',
+              't1586.001',
+              't1586.002',
+              't1587',
+              't1587.001',
+              't1587.002',
+              't1587.003',
+              't1587.004',
+              't1588',
+              't1588.001',
+              't1588.002',
+              't1588.003',
+              't1588.004',
+              't1588.005',
+              't1588.006',
+              't1589',
+              't1589.001',
+              't1589.002',
+              't1589.003',
+              't1590',
+              't1590.001',
+              't1590.002',
+              't1590.003',
+              't1590.004',
+              't1590.005',
+              't1590.006',
+              't1591',
+              't1591.001',
+              't1591.002',
+              't1591.003',
+              't1591.004',
+              't1592',
+              't1592.001',
+              't1592.002',
+              't1592.003',
+              't1592.004',
+              't1593',
+              't1593.001',
+              't1593.002',
+              't1594',
+              't1595',
+              't1595.001',
+              't1595.002',
+              't1595.003',
+              't1596',
+              't1596.001',
+              't1596.002',
+              't1596.003',
+              't1596.004',
+              't1596.005',
+              't1597',
+              't1597.001',
+              't1597.002',
+              't1598',
+              't1598.001',
+              't1598.002',
+              't1598.003',
+              't1599',
+              't1599.001',
+              't1600',
+              't1600.001',
+              't1600.002',
+              't1601',
+              't1601.001',
+              't1601.002',
+              't1602',
+              't1602.001',
+              't1602.002',
+              't1606',
+              't1606.001',
+              't1606.002',
+              't1608',
+              't1608.001',
+              't1608.002',
+              't1608.003',
+              't1608.004',
+              't1608.005',
+              't1609',
+              't1610',
+              't1611',
+              't1612',
+              't1613',
+              't1614',
+              't1614.001',
+              't1615',
+              't1619',
+              't1620',
+              't1621',
+              't1622',
+              't1647'})
@@ -4,6 +4,7 @@ from typing import Dict, Optional, Union, Sequence, List, Mapping, Type
 from uuid import UUID
 from enum import Enum, auto
 from datetime import date
+import sys
 import yaml
 import sigma
 from sigma.types import SigmaType, SigmaNull, SigmaString, SigmaNumber, sigma_type
@@ -31,7 +32,7 @@ class SigmaLevel(EnumLowercaseStringMixin, Enum):
     HIGH          = auto()
     CRITICAL      = auto()
 
-@dataclass
+@dataclass(frozen=True)
 class SigmaRuleTag:
     namespace : str
     name : str
@@ -44,7 +45,7 @@ class SigmaRuleTag:
             ns, n = tag.split(".", maxsplit=1)
         except ValueError as e:
             raise SigmaValueError("Sigma tag must start with namespace separated with dot from remaining tag.")
-        return cls(ns, n)
+        return cls(sys.intern(ns), n)     # interned namespace allows identity comparison with namespace literals
 
     def __str__(self) -> str:
         return f"{self.namespace}.{self.name}"
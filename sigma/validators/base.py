@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, fields
 from enum import Enum, auto
-from typing import ClassVar, List, Optional, Set, Type
+from typing import ClassVar, FrozenSet, List, Optional, Sequence, Set, Type
 from sigma.rule import SigmaDetection, SigmaDetectionItem, SigmaRule, SigmaRuleTag
 from sigma.types import SigmaString, SigmaType
 
@@ -28,6 +28,7 @@ class SigmaValidationIssue(ABC):
     information defined statically for the class. Additional issue information should be provided by
     additional fields that are automatically rendered in the representation methods.
     """
+    __slots__ = ("rules",)
     description : ClassVar[str] = "Sigma rule validation issue"
     severity    : ClassVar[SigmaValidationIssueSeverity]
     rules       : List[SigmaRule]
@@ -218,16 +219,37 @@ class SigmaStringValueValidator(SigmaValueValidator):
 class SigmaTagValidator(SigmaRuleValidator):
     """
     The tag validator iterates over all tags from the rule and calls the method validate_tag() for
-    each tag.
+    each tag. If validated_namespace is set, only tags from this namespace are passed to
+    validate_tag(). If additionally allowed_tags is set, the tag names are checked against it with
+    a single set difference and only tags with names not contained in it are passed to
+    validate_tag().
     """
+    validated_namespace : ClassVar[Optional[str]] = None
+    allowed_tags : ClassVar[Optional[FrozenSet[str]]] = None
+
     def validate(self, rule: SigmaRule) -> List[SigmaValidationIssue]:
         super().validate(rule)
+        namespace = self.validated_namespace
+        tags = [
+            tag
+            for tag in rule.tags
+            if namespace is None or tag.namespace == namespace
+        ]
+        if self.allowed_tags is not None:
+            invalid_names = { tag.name for tag in tags } - self.allowed_tags
+            if not invalid_names:
+                return []
+            tags = [        # keep order of tag appearance in rule
+                tag
+                for tag in tags
+                if tag.name in invalid_names
+            ]
         return [
             issue
-            for tag in rule.tags
+            for tag in tags
             for issue in self.validate_tag(tag)
         ]
 
     @abstractmethod
-    def validate_tag(self, tag: SigmaRuleTag) -> List[SigmaValidationIssue]:
+    def validate_tag(self, tag: SigmaRuleTag) -> Sequence[SigmaValidationIssue]:
         """Validates a tag."""
\ No newline at end of file
@@ -1,62 +1,66 @@
 from dataclasses import dataclass
-from typing import ClassVar, List, Set
+from typing import ClassVar, FrozenSet, Sequence, Tuple
 from sigma.rule import SigmaRule, SigmaRuleTag
 from sigma.validators.base import SigmaRuleValidator, SigmaTagValidator, SigmaValidationIssue, SigmaValidationIssueSeverity
-from sigma.data.mitre_attack import mitre_attack_tactics, mitre_attack_techniques
+from sigma.data.mitre_attack import mitre_attack_tactics_normalized, mitre_attack_technique_ids_lower
+
+# Returned for valid tags to avoid allocation of an empty list for each of them.
+_NO_ISSUES: Tuple[SigmaValidationIssue, ...] = ()
+
+# Allowed tag names are precomputed in normalized form in the MITRE ATT&CK data module.
+_ALLOWED_ATTACK_TAGS: FrozenSet[str] = mitre_attack_tactics_normalized | mitre_attack_technique_ids_lower
 
 @dataclass
 class InvalidATTACKTagIssue(SigmaValidationIssue):
+    __slots__ = ("tag",)
     description: ClassVar[str] = "Invalid MITRE ATT&CK tagging"
     severity: ClassVar[SigmaValidationIssueSeverity] = SigmaValidationIssueSeverity.MEDIUM
     tag: SigmaRuleTag
 
 class ATTACKTagValidator(SigmaTagValidator):
-    def __init__(self) -> None:
-        self.allowed_tags = {
-            tactic.lower().replace("-", "_")
-            for tactic in mitre_attack_tactics.values()
-        }.union({
-            technique.lower()
-            for technique in mitre_attack_techniques.keys()
-        })
-
-    def validate_tag(self, tag: SigmaRuleTag) -> List[SigmaValidationIssue]:
-        if tag.namespace == "attack" and tag.name not in self.allowed_tags:
+    validated_namespace: ClassVar[str] = "attack"
+    allowed_tags: ClassVar[FrozenSet[str]] = _ALLOWED_ATTACK_TAGS
+
+    def validate_tag(self, tag: SigmaRuleTag) -> Sequence[SigmaValidationIssue]:
+        if tag.name not in self.allowed_tags:
             return [ InvalidATTACKTagIssue([ self.rule ], tag) ]
-        return []
+        return _NO_ISSUES
 
 @dataclass
 class InvalidTLPTagIssue(SigmaValidationIssue):
+    __slots__ = ("tag",)
     description: ClassVar[str] = "Invalid TLP tagging"
     severity: ClassVar[SigmaValidationIssueSeverity] = SigmaValidationIssueSeverity.MEDIUM
     tag: SigmaRuleTag
 
 class TLPTagValidatorBase(SigmaTagValidator):
     """Base class for TLP tag validation"""
-    def validate_tag(self, tag: SigmaRuleTag) -> List[SigmaValidationIssue]:
-        if tag.namespace == "tlp" and tag.name not in self.allowed_tags:
+    validated_namespace: ClassVar[str] = "tlp"
+
+    def validate_tag(self, tag: SigmaRuleTag) -> Sequence[SigmaValidationIssue]:
+        if tag.name not in self.allowed_tags:
             return [ InvalidTLPTagIssue([ self.rule ], tag) ]
-        return []
+        return _NO_ISSUES
 
 class TLPv1TagValidator(TLPTagValidatorBase):
     """Validation of TLP tags according to old version 1 standard."""
-    allowed_tags: Set[str] = {
+    allowed_tags: ClassVar[FrozenSet[str]] = frozenset({
         "white",
         "green",
         "amber",
         "red",
-    }
+    })
 
 class TLPv2TagValidator(TLPTagValidatorBase):
     """Validation of TLP tags according to version 2 standard."""
-    allowed_tags: Set[str] = {
+    allowed_tags: ClassVar[FrozenSet[str]] = frozenset({
         "clear",
         "green",
         "amber",
         "amber+strict",
         "red",
-    }
+    })
 
 class TLPTagValidator(TLPTagValidatorBase):
     """Validation of TLP tags from all versions of the TLP standard."""
-    allowed_tags: Set[str] = TLPv1TagValidator.allowed_tags.union(TLPv2TagValidator.allowed_tags)
\ No newline at end of file
+    allowed_tags: ClassVar[FrozenSet[str]] = TLPv1TagValidator.allowed_tags | TLPv2TagValidator.allowed_tags
\ No newline at end of file
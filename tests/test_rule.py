@@ -1,4 +1,6 @@
 import pytest
+import dataclasses
+import pickle
 from datetime import date
 from uuid import UUID
 from sigma import conditions
@@ -28,6 +30,22 @@ def test_sigmaruletag_fromstr_nodot():
 def test_sigmaruletag_fromstr_3dots():
     assert SigmaRuleTag.from_str("namespace.subnamespace.tag") == SigmaRuleTag("namespace", "subnamespace.tag")
 
+def test_sigmaruletag_hash():
+    assert { SigmaRuleTag.from_str("namespace.name"), SigmaRuleTag("namespace", "name"), SigmaRuleTag("namespace", "other") } == {
+        SigmaRuleTag("namespace", "name"),
+        SigmaRuleTag("namespace", "other"),
+    }
+
+def test_sigmaruletag_pickle():
+    tag = SigmaRuleTag.from_str("attack.t1001")
+    unpickled = pickle.loads(pickle.dumps(tag))
+    assert unpickled == tag and hash(unpickled) == hash(tag)
+    assert unpickled in { tag }
+
+def test_sigmaruletag_immutable():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        SigmaRuleTag("namespace", "name").name = "other"
+
 ### SigmaLogSource tests ###
 
 def test_sigmalogsource_fromdict():
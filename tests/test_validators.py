@@ -10,6 +10,7 @@ from sigma.types import SigmaString
 from sigma.validators.metadata import IdentifierCollisionIssue, IdentifierExistenceIssue, IdentifierExistenceValidator, IdentifierUniquenessValidator
 from sigma.validators.condition import DanglingDetectionIssue, DanglingDetectionValidator
 from sigma.validators.modifiers import AllWithoutContainsModifierIssue, Base64OffsetWithoutContainsModifierIssue, InvalidModifierCombinationsValidator, ModifierAppliedMultipleIssue
+from sigma.data.mitre_attack import mitre_attack_tactics, mitre_attack_techniques, mitre_attack_tactics_normalized, mitre_attack_technique_ids_lower
 from sigma.validators.tags import ATTACKTagValidator, InvalidATTACKTagIssue, InvalidTLPTagIssue, TLPTagValidator, TLPv1TagValidator, TLPv2TagValidator
 from sigma.validators.values import ControlCharacterIssue, ControlCharacterValidator, DoubleWildcardIssue, DoubleWildcardValidator, NumberAsStringIssue, NumberAsStringValidator, WildcardInsteadOfEndswithIssue, WildcardInsteadOfStartswithIssue, WildcardsInsteadOfContainsModifierIssue, WildcardsInsteadOfModifiersValidator
 
@@ -522,6 +523,58 @@ def test_validator_valid_attack_tags():
     """)
     assert validator.validate(rule) == [ ]
 
+def test_mitre_attack_normalized_data_in_sync():
+    assert mitre_attack_tactics_normalized == frozenset(
+        tactic.lower().replace("-", "_")
+        for tactic in mitre_attack_tactics.values()
+    )
+    assert mitre_attack_technique_ids_lower == frozenset(
+        technique.lower()
+        for technique in mitre_attack_techniques.keys()
+    )
+
+def test_validator_tag_issue_slots():
+    issue = InvalidATTACKTagIssue([], SigmaRuleTag.from_str("attack.test1"))
+    assert not hasattr(issue, "__dict__")
+
+def test_validator_attack_tags_other_namespace():
+    validator = ATTACKTagValidator()
+    rule = SigmaRule.from_yaml("""
+    title: Test
+    status: test
+    logsource:
+        category: test
+    detection:
+        sel:
+            field: value
+        condition: sel
+    tags:
+        - attack.test1
+        - tlp.test1
+        - attack.t1001.001
+    """)
+    assert validator.validate(rule) == [
+        InvalidATTACKTagIssue([ rule ], SigmaRuleTag.from_str("attack.test1")),
+    ]
+
+def test_validator_attack_tags_validate_tag():
+    validator = ATTACKTagValidator()
+    rule = SigmaRule.from_yaml("""
+    title: Test
+    status: test
+    logsource:
+        category: test
+    detection:
+        sel:
+            field: value
+        condition: sel
+    """)
+    validator.validate(rule)
+    assert list(validator.validate_tag(SigmaRuleTag.from_str("attack.t1001.001"))) == [ ]
+    assert list(validator.validate_tag(SigmaRuleTag.from_str("attack.test1"))) == [
+        InvalidATTACKTagIssue([ rule ], SigmaRuleTag.from_str("attack.test1")),
+    ]
+
 @pytest.mark.parametrize(
     "validator_class,tags,issue_tags", [
         (TLPv1TagValidator, [ "tlp.clear", "tlp.white" ], [ "tlp.clear" ]),
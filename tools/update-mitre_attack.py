@@ -31,7 +31,12 @@ for stix_file in args.stix:
                     attack_version = obj["x_mitre_version"]
 
 print(f"Found { len(tactics) } tactics and { len(techniques) } techniques", file=stderr)
-print("from typing import Dict", file=args.output)
+print("from typing import Dict, FrozenSet", file=args.output)
 print(f'mitre_attack_version: str = "{ attack_version }"', file=args.output)
 print("mitre_attack_tactics: Dict[str, str] = " + pformat(tactics, indent=4, sort_dicts=True), file=args.output)
-print("mitre_attack_techniques: Dict[str, str] = " + pformat(techniques, indent=4, sort_dicts=True), file=args.output)
\ No newline at end of file
+print("mitre_attack_techniques: Dict[str, str] = " + pformat(techniques, indent=4, sort_dicts=True), file=args.output)
+# Normalized forms as used in Sigma tags, precomputed to avoid normalization at runtime.
+tactics_normalized = frozenset(tactic.lower().replace("-", "_") for tactic in tactics.values())
+technique_ids_lower = frozenset(technique.lower() for technique in techniques.keys())
+print("mitre_attack_tactics_normalized: FrozenSet[str] = " + pformat(tactics_normalized, indent=4), file=args.output)
+print("mitre_attack_technique_ids_lower: FrozenSet[str] = " + pformat(technique_ids_lower, indent=4), file=args.output)
\ No newline at end of file